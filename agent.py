@@ -6,8 +6,54 @@ Combines analysis and optimization capabilities for comprehensive CV improvement
 
 from cv_analyzer import CVAnalyzer, CVAnalysisResult
 from cv_optimizer import CVOptimizer
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from heapq import nlargest
+from operator import itemgetter
 import argparse
+import sys
+
+
+# Improvement tips by category, built once at import
+_TIPS: Dict[str, Tuple[str, ...]] = {
+    'general': (
+        "Keep your CV to 1-2 pages for most roles",
+        "Use a clean, professional font (Arial, Calibri, or Times New Roman)",
+        "Maintain consistent formatting throughout",
+        "Proofread carefully - typos are deal-breakers",
+        "Update your CV for each application"
+    ),
+    'ats': (
+        "Use standard section headers (Work Experience, Education, Skills)",
+        "Avoid headers, footers, and text boxes",
+        "Don't use tables or columns for layout",
+        "Save as .docx or .pdf (check job posting requirements)",
+        "Use standard bullet points, not special characters",
+        "Spell out acronyms at least once"
+    ),
+    'keywords': (
+        "Mirror language from the job description",
+        "Include both acronyms and full terms (e.g., 'AI' and 'Artificial Intelligence')",
+        "Place keywords in context, not just in a list",
+        "Include technical skills, soft skills, and certifications",
+        "Use industry-standard terminology"
+    ),
+    'formatting': (
+        "Use consistent date formats (e.g., 'Jan 2020 - Dec 2022')",
+        "Left-align all text for ATS readability",
+        "Use simple bullet points (-, •, or *)",
+        "Maintain adequate white space",
+        "Avoid fancy fonts, colors, or graphics"
+    ),
+    'content': (
+        "Start bullets with strong action verbs",
+        "Quantify achievements with numbers and percentages",
+        "Focus on results, not just responsibilities",
+        "Use the STAR method (Situation, Task, Action, Result)",
+        "Tailor content to the target role",
+        "Remove outdated or irrelevant experience"
+    ),
+}
 
 
 class CVAgent:
@@ -40,13 +86,16 @@ class CVAgent:
             Dictionary with analysis results and optimization suggestions
         """
         print("🔍 Analyzing your CV...")
-        
-        # Step 1: Analyze the current CV
-        analysis = self.analyzer.analyze_cv(cv_text, job_description)
-        
-        # Step 2: Optimize the CV content
         print("✨ Optimizing your CV...")
-        optimized_cv = self.optimizer.optimize_cv_text(cv_text, target_role, industry)
+        
+        # Steps 1 and 2 are independent: optimize the CV content in a worker
+        # thread while the current CV is analyzed in this one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            optimize_future = executor.submit(
+                self.optimizer.optimize_cv_text, cv_text, target_role, industry
+            )
+            analysis = self.analyzer.analyze_cv(cv_text, job_description)
+            optimized_cv = optimize_future.result()
         
         # Step 3: Get keyword suggestions if industry provided
         suggested_keywords = []
@@ -78,80 +127,85 @@ class CVAgent:
         """
         Print a comprehensive report of analysis and recommendations
         
+        The report is assembled in memory and written with a single call.
+        
         Args:
             results: Results dictionary from analyze_and_optimize
         """
         analysis: CVAnalysisResult = results['analysis']
+        lines = []
+        add = lines.append
         
-        print("\n" + "=" * 70)
-        print("CV OPTIMIZATION REPORT")
-        print("=" * 70)
+        add("\n" + "=" * 70)
+        add("CV OPTIMIZATION REPORT")
+        add("=" * 70)
         
         # Scores
-        print(f"\n📊 SCORES:")
-        print(f"   Overall Quality Score:    {analysis.overall_score}/100")
-        print(f"   ATS Compatibility Score:  {analysis.ats_compatibility_score}/100")
+        add(f"\n📊 SCORES:")
+        add(f"   Overall Quality Score:    {analysis.overall_score}/100")
+        add(f"   ATS Compatibility Score:  {analysis.ats_compatibility_score}/100")
         
         # Interpretation
         if analysis.overall_score >= 80:
-            print("   ✅ Excellent! Your CV is in great shape.")
+            add("   ✅ Excellent! Your CV is in great shape.")
         elif analysis.overall_score >= 60:
-            print("   ⚠️  Good, but there's room for improvement.")
+            add("   ⚠️  Good, but there's room for improvement.")
         else:
-            print("   ❌ Needs significant improvements to be competitive.")
+            add("   ❌ Needs significant improvements to be competitive.")
         
         # Strengths
-        print(f"\n💪 STRENGTHS ({len(analysis.strengths)}):")
+        add(f"\n💪 STRENGTHS ({len(analysis.strengths)}):")
         for strength in analysis.strengths:
-            print(f"   ✓ {strength}")
+            add(f"   ✓ {strength}")
         
         # Weaknesses
-        print(f"\n⚠️  WEAKNESSES ({len(analysis.weaknesses)}):")
+        add(f"\n⚠️  WEAKNESSES ({len(analysis.weaknesses)}):")
         for weakness in analysis.weaknesses:
-            print(f"   ✗ {weakness}")
+            add(f"   ✗ {weakness}")
         
         # Formatting Issues
         if analysis.formatting_issues:
-            print(f"\n🔧 ATS FORMATTING ISSUES ({len(analysis.formatting_issues)}):")
+            add(f"\n🔧 ATS FORMATTING ISSUES ({len(analysis.formatting_issues)}):")
             for issue in analysis.formatting_issues:
-                print(f"   ⚠️  {issue}")
+                add(f"   ⚠️  {issue}")
         
         # Recommendations
-        print(f"\n💡 RECOMMENDATIONS ({len(analysis.recommendations)}):")
+        add(f"\n💡 RECOMMENDATIONS ({len(analysis.recommendations)}):")
         for i, rec in enumerate(analysis.recommendations, 1):
-            print(f"   {i}. {rec}")
+            add(f"   {i}. {rec}")
         
         # Keyword Analysis
         if analysis.keyword_analysis:
-            print(f"\n🔑 KEYWORD MATCHES ({len(analysis.keyword_analysis)}):")
-            sorted_keywords = sorted(
-                analysis.keyword_analysis.items(), 
-                key=lambda x: x[1], 
-                reverse=True
+            add(f"\n🔑 KEYWORD MATCHES ({len(analysis.keyword_analysis)}):")
+            top_keywords = nlargest(
+                10, analysis.keyword_analysis.items(), key=itemgetter(1)
             )
-            for keyword, count in sorted_keywords[:10]:
-                print(f"   • {keyword}: {count} occurrences")
+            for keyword, count in top_keywords:
+                add(f"   • {keyword}: {count} occurrences")
         
         # Suggested Keywords
         if results['suggested_keywords']:
-            print(f"\n📌 SUGGESTED KEYWORDS TO CONSIDER:")
+            add(f"\n📌 SUGGESTED KEYWORDS TO CONSIDER:")
             keywords_str = ", ".join(results['suggested_keywords'][:15])
-            print(f"   {keywords_str}")
+            add(f"   {keywords_str}")
         
         # Job-Specific Suggestions
         if results['job_specific_suggestions']:
-            print(f"\n🎯 JOB-SPECIFIC SUGGESTIONS:")
+            add(f"\n🎯 JOB-SPECIFIC SUGGESTIONS:")
             for suggestion in results['job_specific_suggestions']:
-                print(f"   • {suggestion}")
+                add(f"   • {suggestion}")
+        
+        add("\n" + "=" * 70)
+        add("📝 NEXT STEPS:")
+        add("   1. Address critical ATS formatting issues first")
+        add("   2. Incorporate recommended keywords naturally")
+        add("   3. Strengthen weak phrases with action verbs")
+        add("   4. Add quantifiable metrics to achievements")
+        add("   5. Tailor your CV for each specific job application")
+        add("=" * 70 + "\n")
         
-        print("\n" + "=" * 70)
-        print("📝 NEXT STEPS:")
-        print("   1. Address critical ATS formatting issues first")
-        print("   2. Incorporate recommended keywords naturally")
-        print("   3. Strengthen weak phrases with action verbs")
-        print("   4. Add quantifiable metrics to achievements")
-        print("   5. Tailor your CV for each specific job application")
-        print("=" * 70 + "\n")
+        add("")  # Terminate the final line like print() would
+        sys.stdout.write("\n".join(lines))
     
     def get_improvement_tips(self, category: str = "general") -> List[str]:
         """
@@ -163,47 +217,27 @@ class CVAgent:
         Returns:
             List of tips
         """
-        tips = {
-            'general': [
-                "Keep your CV to 1-2 pages for most roles",
-                "Use a clean, professional font (Arial, Calibri, or Times New Roman)",
-                "Maintain consistent formatting throughout",
-                "Proofread carefully - typos are deal-breakers",
-                "Update your CV for each application"
-            ],
-            'ats': [
-                "Use standard section headers (Work Experience, Education, Skills)",
-                "Avoid headers, footers, and text boxes",
-                "Don't use tables or columns for layout",
-                "Save as .docx or .pdf (check job posting requirements)",
-                "Use standard bullet points, not special characters",
-                "Spell out acronyms at least once"
-            ],
-            'keywords': [
-                "Mirror language from the job description",
-                "Include both acronyms and full terms (e.g., 'AI' and 'Artificial Intelligence')",
-                "Place keywords in context, not just in a list",
-                "Include technical skills, soft skills, and certifications",
-                "Use industry-standard terminology"
-            ],
-            'formatting': [
-                "Use consistent date formats (e.g., 'Jan 2020 - Dec 2022')",
-                "Left-align all text for ATS readability",
-                "Use simple bullet points (-, •, or *)",
-                "Maintain adequate white space",
-                "Avoid fancy fonts, colors, or graphics"
-            ],
-            'content': [
-                "Start bullets with strong action verbs",
-                "Quantify achievements with numbers and percentages",
-                "Focus on results, not just responsibilities",
-                "Use the STAR method (Situation, Task, Action, Result)",
-                "Tailor content to the target role",
-                "Remove outdated or irrelevant experience"
-            ]
-        }
+        return list(_TIPS.get(category.lower(), _TIPS['general']))
+
+
+def read_text_file(path: str) -> str:
+    """
+    Read a UTF-8 text file in a single binary read and decode it once
+    
+    Args:
+        path: Path to the text file
         
-        return tips.get(category.lower(), tips['general'])
+    Returns:
+        File contents with line endings normalized to '\\n'
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    text = data.decode('utf-8')
+    # Match text-mode universal newlines, but only pay for it when needed
+    if b'\r' in data:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def main():
@@ -258,8 +292,7 @@ def main():
     
     # Read CV file
     try:
-        with open(args.cv_file, 'r', encoding='utf-8') as f:
-            cv_text = f.read()
+        cv_text = read_text_file(args.cv_file)
     except FileNotFoundError:
         print(f"❌ Error: CV file '{args.cv_file}' not found")
         return
@@ -271,8 +304,7 @@ def main():
     job_description = ""
     if args.job_description:
         try:
-            with open(args.job_description, 'r', encoding='utf-8') as f:
-                job_description = f.read()
+            job_description = read_text_file(args.job_description)
         except Exception as e:
             print(f"⚠️  Warning: Could not read job description file: {e}")
     
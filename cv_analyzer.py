@@ -4,9 +4,39 @@ CV Analyzer - Core module for analyzing and optimizing CVs
 Part of the work-serch AI agent system
 """
 
+import hashlib
 import re
+import sys
+import threading
+from collections import Counter, OrderedDict
+from itertools import chain
 from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+
+# Candidate keywords: words of three or more letters in lower-cased text
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+# Numbers and percentages that quantify an achievement
+_NUMBER_RE = re.compile(r'\b\d+[%\w]*\b')
+
+# Percentages such as "25%"
+_PCT_RE = re.compile(r'\b\d+%')
+
+# Patterns the missing-section checks count directly, whatever the sections
+_SECTION_CHECK_PATTERNS = ('experience', 'employment', 'education', 'skills')
+
+# Bit flags recording which weaknesses were identified
+MISSING_SECTION = 1
+WEAK_LANGUAGE = 2
+TOO_SHORT = 4
+TOO_LONG = 8
+FORMATTING_ISSUES = 16
+
+
+def _counted_patterns(*groups) -> Tuple[str, ...]:
+    """Every distinct pattern in groups, interned for the identity fast path"""
+    return tuple(set(map(sys.intern, chain.from_iterable(groups))))
 
 
 @dataclass
@@ -21,53 +51,122 @@ class CVAnalysisResult:
     formatting_issues: List[str]
 
 
+def _copy_result(result: CVAnalysisResult) -> CVAnalysisResult:
+    """Copy a result so callers never share its lists or dict with the cache"""
+    return replace(
+        result,
+        strengths=list(result.strengths),
+        weaknesses=list(result.weaknesses),
+        recommendations=list(result.recommendations),
+        keyword_analysis=dict(result.keyword_analysis),
+        formatting_issues=list(result.formatting_issues),
+    )
+
+
 class CVAnalyzer:
     """Analyzes CVs for ATS compatibility and quality"""
     
+    # Analyzers hold no per-instance state; results live in the shared cache
+    __slots__ = ()
+    
+    # Pattern strings below are interned so every pattern-count lookup
+    # hits the identity fast path
+    
     # Standard ATS-friendly section headers
-    STANDARD_SECTIONS = [
+    STANDARD_SECTIONS = frozenset(map(sys.intern, (
         'work experience', 'professional experience', 'employment history',
         'education', 'skills', 'technical skills', 'certifications',
         'summary', 'professional summary', 'objective', 'profile',
         'achievements', 'accomplishments', 'projects', 'publications'
-    ]
+    )))
     
     # Strong action verbs for CVs
-    ACTION_VERBS = [
+    ACTION_VERBS = tuple(map(sys.intern, (
         'achieved', 'implemented', 'developed', 'managed', 'led', 'created',
         'improved', 'increased', 'decreased', 'optimized', 'delivered',
         'designed', 'built', 'established', 'launched', 'spearheaded',
         'orchestrated', 'transformed', 'streamlined', 'negotiated', 'directed'
-    ]
+    )))
+    
+    # Common ATS-unfriendly formatting elements as (characters, description);
+    # non-ASCII text in general is detected separately with str.isascii
+    ATS_PROBLEMATIC_PATTERNS = (
+        ('|', 'pipe characters'),
+        ('\u2022\u2023\u25E6\u2043\u2219', 'special bullet points'),
+    )
+    
+    # Sections every CV is expected to have
+    ESSENTIAL_SECTIONS = tuple(map(sys.intern, ('experience', 'education', 'skills')))
     
-    # Common ATS-unfriendly formatting elements
-    ATS_PROBLEMATIC_PATTERNS = [
-        (r'\|', 'pipe characters'),
-        (r'[\u2022\u2023\u25E6\u2043\u2219]', 'special bullet points'),
-        (r'[^\x00-\x7F]', 'non-ASCII characters'),
-    ]
+    # Passive phrases that should be replaced with action verbs
+    WEAK_PHRASES = tuple(map(sys.intern, ('responsible for', 'duties included', 'worked on')))
     
-    def __init__(self):
-        self.analysis_cache = {}
+    # Every fixed pattern the analysis counts, deduplicated once at class
+    # load; rebuilt for subclasses in __init_subclass__
+    _COUNTED_PATTERNS = _counted_patterns(
+        STANDARD_SECTIONS, ACTION_VERBS, WEAK_PHRASES,
+        ESSENTIAL_SECTIONS, _SECTION_CHECK_PATTERNS
+    )
+    
+    # Maximum number of analyses kept in analysis_cache
+    CACHE_SIZE = 128
+    
+    # LRU cache shared by all instances of a class, so short-lived analyzers
+    # (e.g. one per request) still benefit from earlier analyses. Each
+    # subclass gets its own cache, as it may analyze differently. Entries
+    # are private copies that are never mutated or handed out; callers get
+    # a fresh copy
+    analysis_cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Give each subclass its own cache and pattern table"""
+        super().__init_subclass__(**kwargs)
+        if 'analysis_cache' not in cls.__dict__:
+            cls.analysis_cache = OrderedDict()
+        cls._COUNTED_PATTERNS = _counted_patterns(
+            cls.STANDARD_SECTIONS, cls.ACTION_VERBS, cls.WEAK_PHRASES,
+            cls.ESSENTIAL_SECTIONS, _SECTION_CHECK_PATTERNS
+        )
     
-    def analyze_cv(self, cv_text: str, job_description: str = "") -> CVAnalysisResult:
+    def analyze_cv(self, cv_text: str, job_description: str = "",
+                   force: bool = False) -> CVAnalysisResult:
         """
         Perform comprehensive CV analysis
         
         Args:
             cv_text: The CV content as plain text
             job_description: Optional job description for keyword matching
+            force: Recompute even if this CV/job description pair is cached
             
         Returns:
             CVAnalysisResult with detailed analysis
         """
+        key = (
+            hashlib.blake2b(cv_text.encode('utf-8', 'surrogatepass'),
+                            digest_size=16).digest(),
+            hashlib.blake2b(job_description.encode('utf-8', 'surrogatepass'),
+                            digest_size=16).digest(),
+        )
+        if not force:
+            with self._cache_lock:
+                cached = self.analysis_cache.get(key)
+                if cached is not None:
+                    self.analysis_cache.move_to_end(key)
+            # Entries are never mutated, so copy outside the shared lock
+            if cached is not None:
+                return _copy_result(cached)
+        
         cv_lower = cv_text.lower()
+        word_count = len(cv_lower.split())
+        pattern_counts = self._count_patterns(cv_lower)
+        action_verb_count = sum(pattern_counts[verb] for verb in self.ACTION_VERBS)
         
         # Analyze various aspects
-        section_score = self._analyze_sections(cv_lower)
-        keyword_score, keywords = self._analyze_keywords(cv_text, job_description)
+        section_score = self._analyze_sections(pattern_counts)
+        keyword_score, keywords = self._analyze_keywords(cv_lower, job_description)
         formatting_issues = self._check_formatting(cv_text)
-        action_verb_score = self._analyze_action_verbs(cv_lower)
+        action_verb_score = self._analyze_action_verbs(action_verb_count, word_count)
         quantification_score = self._analyze_quantification(cv_text)
         
         # Calculate scores
@@ -79,15 +178,19 @@ class CVAnalyzer:
         )
         
         # Identify strengths and weaknesses
-        strengths = self._identify_strengths(cv_text, cv_lower)
-        weaknesses = self._identify_weaknesses(cv_text, cv_lower, formatting_issues)
+        strengths = self._identify_strengths(
+            cv_text, word_count, action_verb_count, pattern_counts
+        )
+        weaknesses, weakness_mask = self._identify_weaknesses(
+            word_count, pattern_counts, formatting_issues
+        )
         
         # Generate recommendations
         recommendations = self._generate_recommendations(
-            weaknesses, formatting_issues, keyword_score, action_verb_score
+            weakness_mask, formatting_issues, keyword_score, action_verb_score
         )
         
-        return CVAnalysisResult(
+        result = CVAnalysisResult(
             overall_score=overall_score,
             ats_compatibility_score=ats_score,
             strengths=strengths,
@@ -96,35 +199,50 @@ class CVAnalyzer:
             keyword_analysis=keywords,
             formatting_issues=formatting_issues
         )
+        
+        # Cache a private copy, evicting the least recently used entry when full
+        entry = _copy_result(result)
+        with self._cache_lock:
+            self.analysis_cache[key] = entry
+            self.analysis_cache.move_to_end(key)
+            if len(self.analysis_cache) > self.CACHE_SIZE:
+                self.analysis_cache.popitem(last=False)
+        
+        return result
+    
+    def _count_patterns(self, cv_lower: str) -> Dict[str, int]:
+        """Count every fixed pattern once so the analyzers share the results"""
+        return {pattern: cv_lower.count(pattern) for pattern in self._COUNTED_PATTERNS}
     
-    def _analyze_sections(self, cv_lower: str) -> int:
+    def _analyze_sections(self, pattern_counts: Dict[str, int]) -> int:
         """Check for standard CV sections"""
-        found_sections = sum(
-            1 for section in self.STANDARD_SECTIONS 
-            if section in cv_lower
-        )
+        found_sections = 0
+        for section in self.STANDARD_SECTIONS:
+            if pattern_counts[section]:
+                found_sections += 1
+                # The score saturates at five sections
+                if found_sections >= 5:
+                    return 100
         # Score based on having at least the essential sections
-        return min(100, (found_sections / 5) * 100)
+        return (found_sections / 5) * 100
     
-    def _analyze_keywords(self, cv_text: str, job_description: str) -> Tuple[int, Dict[str, int]]:
+    def _analyze_keywords(self, cv_lower: str, job_description: str) -> Tuple[int, Dict[str, int]]:
         """Analyze keyword presence and frequency"""
         keywords = {}
         
         if job_description:
             # Extract potential keywords from job description
-            jd_words = re.findall(r'\b[a-zA-Z]{3,}\b', job_description.lower())
-            jd_word_freq = {}
-            for word in jd_words:
-                jd_word_freq[word] = jd_word_freq.get(word, 0) + 1
+            jd_word_freq = Counter(_WORD_RE.findall(job_description.lower()))
+            important_keywords = [w for w, f in jd_word_freq.items() if f > 2]
             
-            # Check which keywords appear in CV
-            cv_lower = cv_text.lower()
-            for word, freq in jd_word_freq.items():
-                if freq > 2 and word in cv_lower:  # Only check important words
-                    keywords[word] = cv_lower.count(word)
+            # Check which keywords appear in CV as whole words
+            cv_word_freq = Counter(_WORD_RE.findall(cv_lower))
+            keywords = {
+                word: cv_word_freq[word]
+                for word in important_keywords if word in cv_word_freq
+            }
             
             # Score based on keyword coverage
-            important_keywords = [w for w, f in jd_word_freq.items() if f > 2]
             if important_keywords:
                 coverage = len(keywords) / len(important_keywords)
                 score = int(coverage * 100)
@@ -139,12 +257,20 @@ class CVAnalyzer:
         """Check for ATS-problematic formatting"""
         issues = []
         
-        for pattern, description in self.ATS_PROBLEMATIC_PATTERNS:
-            if re.search(pattern, cv_text):
+        for characters, description in self.ATS_PROBLEMATIC_PATTERNS:
+            if any(char in cv_text for char in characters):
                 issues.append(f"Contains {description} which may confuse ATS systems")
         
-        # Check for tables (simplified detection)
-        if cv_text.count('\t') > 10:
+        if not cv_text.isascii():
+            issues.append("Contains non-ASCII characters which may confuse ATS systems")
+        
+        # Check for tables (simplified detection), stopping at the 11th tab
+        pos = -1
+        for _ in range(11):
+            pos = cv_text.find('\t', pos + 1)
+            if pos < 0:
+                break
+        else:
             issues.append("Possible table formatting detected - may not parse well in ATS")
         
         # Check for very short lines (possible columns)
@@ -155,15 +281,11 @@ class CVAnalyzer:
         
         return issues
     
-    def _analyze_action_verbs(self, cv_lower: str) -> int:
+    def _analyze_action_verbs(self, action_verb_count: int, word_count: int) -> int:
         """Analyze use of strong action verbs"""
-        action_verb_count = sum(
-            cv_lower.count(verb) for verb in self.ACTION_VERBS
-        )
         # Score based on reasonable action verb density
-        words = cv_lower.split()
-        if len(words) > 0:
-            density = action_verb_count / len(words)
+        if word_count > 0:
+            density = action_verb_count / word_count
             score = min(100, int(density * 1000))  # Scale appropriately
         else:
             score = 0
@@ -171,15 +293,19 @@ class CVAnalyzer:
     
     def _analyze_quantification(self, cv_text: str) -> int:
         """Check for quantified achievements (numbers, percentages, etc.)"""
-        # Look for numbers and percentages
-        numbers = re.findall(r'\b\d+[%\w]*\b', cv_text)
+        # Look for numbers and percentages, stopping once the top bucket is reached
+        numbers = 0
+        for _ in _NUMBER_RE.finditer(cv_text):
+            numbers += 1
+            if numbers > 10:
+                break
         
         # Score based on presence of quantification
-        if len(numbers) > 10:
+        if numbers > 10:
             return 100
-        elif len(numbers) > 5:
+        elif numbers > 5:
             return 75
-        elif len(numbers) > 2:
+        elif numbers > 2:
             return 50
         else:
             return 25
@@ -205,66 +331,77 @@ class CVAnalyzer:
             quantification_score * 0.25
         )
     
-    def _identify_strengths(self, cv_text: str, cv_lower: str) -> List[str]:
+    def _identify_strengths(self, cv_text: str, word_count: int,
+                            action_verb_count: int,
+                            pattern_counts: Dict[str, int]) -> List[str]:
         """Identify CV strengths"""
         strengths = []
         
-        # Check for quantified achievements
-        if len(re.findall(r'\b\d+%', cv_text)) > 3:
+        # Check for quantified achievements, stopping at the fourth percentage
+        pct_count = 0
+        if '%' in cv_text:
+            for _ in _PCT_RE.finditer(cv_text):
+                pct_count += 1
+                if pct_count > 3:
+                    break
+        if pct_count > 3:
             strengths.append("Good use of quantified achievements with percentages")
         
         # Check for action verbs
-        action_verb_count = sum(cv_lower.count(verb) for verb in self.ACTION_VERBS)
         if action_verb_count > 10:
             strengths.append("Strong use of action verbs to describe responsibilities")
         
         # Check for standard sections
-        essential_sections = ['experience', 'education', 'skills']
-        if all(section in cv_lower for section in essential_sections):
+        if all(pattern_counts[section] for section in self.ESSENTIAL_SECTIONS):
             strengths.append("Contains all essential CV sections")
         
         # Check for reasonable length
-        word_count = len(cv_text.split())
         if 300 < word_count < 800:
             strengths.append("Appropriate length - concise yet comprehensive")
         
         return strengths if strengths else ["CV structure is present"]
     
-    def _identify_weaknesses(self, cv_text: str, cv_lower: str, 
-                           formatting_issues: List[str]) -> List[str]:
-        """Identify CV weaknesses"""
+    def _identify_weaknesses(self, word_count: int, pattern_counts: Dict[str, int],
+                           formatting_issues: List[str]) -> Tuple[List[str], int]:
+        """Identify CV weaknesses, returned with a bit mask of their flags"""
         weaknesses = []
+        mask = 0
         
         # Check for missing sections
-        if 'experience' not in cv_lower and 'employment' not in cv_lower:
+        if not pattern_counts['experience'] and not pattern_counts['employment']:
             weaknesses.append("Missing work experience section")
+            mask |= MISSING_SECTION
         
-        if 'education' not in cv_lower:
+        if not pattern_counts['education']:
             weaknesses.append("Missing education section")
+            mask |= MISSING_SECTION
         
-        if 'skills' not in cv_lower:
+        if not pattern_counts['skills']:
             weaknesses.append("Missing skills section")
+            mask |= MISSING_SECTION
         
         # Check for weak language
-        weak_phrases = ['responsible for', 'duties included', 'worked on']
-        weak_count = sum(cv_lower.count(phrase) for phrase in weak_phrases)
+        weak_count = sum(pattern_counts[phrase] for phrase in self.WEAK_PHRASES)
         if weak_count > 3:
             weaknesses.append("Overuse of weak phrases - use stronger action verbs")
+            mask |= WEAK_LANGUAGE
         
         # Check for length issues
-        word_count = len(cv_text.split())
         if word_count < 200:
             weaknesses.append("CV is too short - add more detail about achievements")
+            mask |= TOO_SHORT
         elif word_count > 1000:
             weaknesses.append("CV is too long - focus on most relevant information")
+            mask |= TOO_LONG
         
         # Add formatting issues
         if formatting_issues:
             weaknesses.append(f"ATS formatting concerns: {len(formatting_issues)} issues detected")
+            mask |= FORMATTING_ISSUES
         
-        return weaknesses if weaknesses else ["Minor improvements could be made"]
+        return (weaknesses if weaknesses else ["Minor improvements could be made"]), mask
     
-    def _generate_recommendations(self, weaknesses: List[str], 
+    def _generate_recommendations(self, weakness_mask: int,
                                  formatting_issues: List[str],
                                  keyword_score: int,
                                  action_verb_score: int) -> List[str]:
@@ -279,7 +416,7 @@ class CVAnalyzer:
             )
         
         # Address missing sections
-        if any('missing' in w.lower() for w in weaknesses):
+        if weakness_mask & MISSING_SECTION:
             recommendations.append(
                 "Add all essential sections: Professional Summary, Work Experience, "
                 "Education, Skills, and relevant certifications"
@@ -299,12 +436,11 @@ class CVAnalyzer:
                 "(e.g., 'managed', 'developed', 'achieved', 'implemented')"
             )
         
-        # Quantification
-        if not any('quantified' in s.lower() for s in weaknesses):
-            recommendations.append(
-                "Add quantifiable achievements: Include specific numbers, percentages, "
-                "and metrics to demonstrate impact (e.g., 'Increased sales by 25%')"
-            )
+        # Quantification (no identified weakness covers it, so always advise it)
+        recommendations.append(
+            "Add quantifiable achievements: Include specific numbers, percentages, "
+            "and metrics to demonstrate impact (e.g., 'Increased sales by 25%')"
+        )
         
         # General best practice
         recommendations.append(
@@ -5,7 +5,72 @@ Part of the work-serch AI agent system
 """
 
 import re
-from typing import Dict, List, Tuple
+from collections import Counter, deque
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Candidate job description keywords and the filler words to ignore
+_WORD_RE = re.compile(r'\b[A-Za-z]{3,}\b')
+_STOPWORDS = frozenset({'the', 'and', 'for', 'with', 'that', 'this'})
+
+# Role-specific keyword bundles
+_SENIOR_KW = ('leadership', 'mentoring', 'team management')
+_MANAGER_KW = ('project management', 'stakeholder management',
+               'strategic planning')
+_ENGINEER_KW = ('problem solving', 'technical design', 'code review')
+
+
+@lru_cache(maxsize=32)
+def _compile_phrase_rules(phrases: Tuple[Tuple[str, str], ...]
+                          ) -> Tuple[Callable[[str], str], Tuple[Tuple[str, str, int], ...], int]:
+    """
+    Specialize the weak phrase rewriting for one phrase set
+    
+    Built once per distinct phrase set and shared by every optimizer using it.
+    
+    Args:
+        phrases: (weak phrase, 'strong|alternatives') pairs in priority order
+        
+    Returns:
+        Tuple of (single-pass text rewriter, achievement prefix rewrites as
+        (weak phrase, capitalized replacement, length), longest weak phrase)
+    """
+    # Weak phrases mapped to their first strong alternative, in lower-case
+    # and capitalized form
+    lookup = {}
+    for weak, strong in phrases:
+        first = strong.split('|')[0]
+        # Upper-case only the first letter so user phrases keep their own
+        # casing (str.capitalize would turn "C++" into "c++")
+        lookup[weak.lower()] = (first, first[:1].upper() + first[1:])
+    
+    # One alternation over every phrase, longest first, each phrase in its
+    # own group. Lookarounds rather than \b keep phrases that start or end
+    # with punctuation (e.g. "e.g.", "C++") matchable. The replacement is
+    # picked by group number because IGNORECASE matching uses Unicode case
+    # folding, so the matched text lower-cased is not always a lookup key
+    # (e.g. "Reſponsible for")
+    ordered = sorted(lookup, key=len, reverse=True)
+    pattern = re.compile(
+        r'(?<!\w)(?:' + '|'.join('(%s)' % re.escape(weak) for weak in ordered) + r')(?!\w)',
+        re.IGNORECASE
+    )
+    replacements = (None,) + tuple(lookup[weak] for weak in ordered)
+    
+    def strengthen(match) -> str:
+        matched = match.group(0)
+        strong, capitalized = replacements[match.lastindex]
+        # Follow the case of the matched text, e.g. "Worked on" -> "Developed"
+        return capitalized if matched[0].isupper() else strong
+    
+    achievement_rewrites = tuple(
+        (weak, lookup[weak.lower()][1], len(weak)) for weak, _ in phrases
+    )
+    longest = max(len(weak) for weak, _ in phrases)
+    
+    return partial(pattern.sub, strengthen), achievement_rewrites, longest
 
 
 class CVOptimizer:
@@ -24,37 +89,103 @@ class CVOptimizer:
         'got': 'achieved|obtained|secured|acquired',
     }
     
-    # Industry-specific keywords and skills
-    INDUSTRY_KEYWORDS = {
-        'software': [
+    # Industry-specific keywords and skills. Read-only because keyword
+    # suggestions are cached per class; subclasses may override it
+    INDUSTRY_KEYWORDS = MappingProxyType({
+        'software': (
             'agile', 'scrum', 'ci/cd', 'devops', 'microservices',
             'cloud', 'aws', 'azure', 'docker', 'kubernetes',
             'git', 'rest api', 'database', 'testing', 'debugging'
-        ],
-        'marketing': [
+        ),
+        'marketing': (
             'seo', 'sem', 'content marketing', 'social media',
             'analytics', 'campaign management', 'brand strategy',
             'roi', 'lead generation', 'market research'
-        ],
-        'finance': [
+        ),
+        'finance': (
             'financial analysis', 'forecasting', 'budgeting',
             'risk management', 'compliance', 'reporting',
             'excel', 'financial modeling', 'accounting', 'audit'
-        ],
-        'healthcare': [
+        ),
+        'healthcare': (
             'patient care', 'hipaa', 'ehr', 'clinical',
             'healthcare administration', 'medical records',
             'regulatory compliance', 'quality assurance'
-        ],
-        'sales': [
+        ),
+        'sales': (
             'revenue growth', 'client acquisition', 'pipeline management',
             'crm', 'negotiation', 'account management', 'quota',
             'b2b', 'b2c', 'cold calling', 'relationship building'
-        ]
+        )
+    })
+    
+    # Common section header variations mapped to standard names
+    # Order matters - more specific patterns first
+    _SECTION_MAPPINGS = (
+        (r'\bemployment\s+history\b', 'WORK EXPERIENCE'),
+        (r'\bjob\s+history\b', 'WORK EXPERIENCE'),
+        (r'\bprofessional\s+experience\b', 'WORK EXPERIENCE'),
+        (r'\beducational\s+background\b', 'EDUCATION'),
+        (r'\bacademic\s+background\b', 'EDUCATION'),
+        (r'\bcore\s+competencies\b', 'SKILLS'),
+        (r'\btechnical\s+skills\b', 'TECHNICAL SKILLS'),
+        (r'\bprofessional\s+summary\b', 'SUMMARY'),
+        (r'\bcareer\s+summary\b', 'SUMMARY'),
+        (r'\babout\s+me\b', 'SUMMARY'),
+    )
+    
+    # All header variations in one alternation with a named group each;
+    # the name of the group that matched selects the standard header
+    _SECTION_RE = re.compile(
+        '|'.join('(?P<section%d>%s)' % (i, pattern)
+                 for i, (pattern, _) in enumerate(_SECTION_MAPPINGS)),
+        re.IGNORECASE
+    )
+    _SECTION_DISPATCH = {
+        'section%d' % i: standard
+        for i, (_, standard) in enumerate(_SECTION_MAPPINGS)
     }
     
-    def __init__(self):
-        self.optimization_history = []
+    # Single-character formatting fixes: fancy bullets and em dashes become
+    # hyphens, curly quotes become straight quotes
+    _CHAR_REPLACEMENTS = (
+        ('•', '-'), ('●', '-'), ('■', '-'), ('▪', '-'), ('▸', '-'), ('►', '-'),
+        ('—', '-'),
+        ('\u201c', '"'), ('\u201d', '"'), ('\u201e', '"'),
+        ('\u2018', "'"), ('\u2019', "'"),
+    )
+    
+    # Formatting cleanup patterns
+    _MULTISPACE_RE = re.compile(r' {2,}')
+    _MULTINL_RE = re.compile(r'\n{3,}')
+    
+    # Maximum number of entries kept in optimization_history
+    HISTORY_SIZE = 1000
+    
+    def __init__(self, phrase_improvements: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            phrase_improvements: Optional extra weak -> 'strong|alternatives'
+                phrases, added to (or overriding) PHRASE_IMPROVEMENTS
+                
+        Raises:
+            ValueError: If a weak phrase is empty or only whitespace
+        """
+        self.optimization_history = deque(maxlen=self.HISTORY_SIZE)
+        
+        self.phrase_improvements = dict(self.PHRASE_IMPROVEMENTS)
+        if phrase_improvements:
+            for weak in phrase_improvements:
+                if not weak.strip():
+                    raise ValueError(f"Weak phrase must not be empty: {weak!r}")
+            self.phrase_improvements.update(
+                (weak.lower(), strong) for weak, strong in phrase_improvements.items()
+            )
+        (self._rewrite_weak_phrases,
+         self._achievement_rewrites,
+         self._weak_prefix_len) = _compile_phrase_rules(
+            tuple(self.phrase_improvements.items())
+        )
     
     def optimize_cv_text(self, cv_text: str, target_role: str = "",
                         industry: str = "") -> str:
@@ -79,65 +210,41 @@ class CVOptimizer:
         return optimized
     
     def _improve_weak_phrases(self, text: str) -> str:
-        """Replace weak phrases with stronger alternatives"""
-        improved = text
-        
-        for weak, strong_options in self.PHRASE_IMPROVEMENTS.items():
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(weak), re.IGNORECASE)
-            
-            if pattern.search(improved):
-                # Use the first strong alternative for automated replacement
-                strong = strong_options.split('|')[0]
-                improved = pattern.sub(strong.capitalize() 
-                                      if weak[0].isupper() else strong, 
-                                      improved)
-        
-        return improved
+        """
+        Replace weak phrases with stronger alternatives
+        
+        >>> CVOptimizer()._improve_weak_phrases('Reſponsible for QA')
+        'Managed QA'
+        >>> CVOptimizer()._improve_weak_phrases('İnvolved in y')
+        'Participated in y'
+        >>> CVOptimizer({'e.g.': 'for example', 'C++': 'C++17'}
+        ...             )._improve_weak_phrases('I used e.g. C++ and C++11')
+        'I used for example C++17 and C++11'
+        """
+        return self._rewrite_weak_phrases(text)
     
     def _standardize_sections(self, text: str) -> str:
         """Standardize section headers for ATS compatibility"""
-        # Common variations to standard names
-        # Order matters - more specific patterns first
-        section_mappings = [
-            (r'\bemployment\s+history\b', 'WORK EXPERIENCE'),
-            (r'\bjob\s+history\b', 'WORK EXPERIENCE'),
-            (r'\bprofessional\s+experience\b', 'WORK EXPERIENCE'),
-            (r'\beducational\s+background\b', 'EDUCATION'),
-            (r'\bacademic\s+background\b', 'EDUCATION'),
-            (r'\bcore\s+competencies\b', 'SKILLS'),
-            (r'\btechnical\s+skills\b', 'TECHNICAL SKILLS'),
-            (r'\bprofessional\s+summary\b', 'SUMMARY'),
-            (r'\bcareer\s+summary\b', 'SUMMARY'),
-            (r'\babout\s+me\b', 'SUMMARY'),
-        ]
-        
-        standardized = text
-        for pattern, standard in section_mappings:
-            standardized = re.sub(pattern, standard, standardized, 
-                                flags=re.IGNORECASE)
-        
-        return standardized
+        return self._SECTION_RE.sub(
+            lambda match: self._SECTION_DISPATCH[match.lastgroup], text
+        )
     
     def _clean_formatting(self, text: str) -> str:
         """Clean problematic formatting for ATS"""
+        # Replace fancy bullets, em dashes and quotes; all of them are
+        # non-ASCII, so plain ASCII text skips this entirely
         cleaned = text
+        if not cleaned.isascii():
+            for fancy, plain in self._CHAR_REPLACEMENTS:
+                cleaned = cleaned.replace(fancy, plain)
         
-        # Replace fancy bullets with simple dashes or asterisks
-        cleaned = re.sub(r'[•●■▪▸►]', '-', cleaned)
-        
-        # Replace em dashes with regular hyphens
-        cleaned = re.sub(r'—', '-', cleaned)
-        
-        # Replace fancy quotes with straight quotes
-        cleaned = re.sub(r'["""]', '"', cleaned)
-        cleaned = re.sub(r"['']", "'", cleaned)
-        
-        # Remove multiple consecutive spaces
-        cleaned = re.sub(r' +', ' ', cleaned)
+        # Remove multiple consecutive spaces (only runs need rewriting)
+        if '  ' in cleaned:
+            cleaned = self._MULTISPACE_RE.sub(' ', cleaned)
         
         # Normalize line breaks
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        if '\n\n\n' in cleaned:
+            cleaned = self._MULTINL_RE.sub('\n\n', cleaned)
         
         return cleaned
     
@@ -152,28 +259,39 @@ class CVOptimizer:
         Returns:
             List of recommended keywords
         """
+        return list(self._suggest_keywords_cached(industry, role))
+    
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _suggest_keywords_cached(cls, industry: str, role: str) -> Tuple[str, ...]:
+        """Cached keyword suggestions; a tuple so entries stay immutable"""
         keywords = []
         
-        # Get industry-specific keywords
-        industry_lower = industry.lower()
-        for ind, kw_list in self.INDUSTRY_KEYWORDS.items():
-            if ind in industry_lower:
-                keywords.extend(kw_list)
-                break
-        
-        # Add role-specific keywords if provided
+        # Role-specific keywords come first: they are the most targeted, and
+        # callers that show only a prefix (e.g. the report) keep them
         if role:
             role_lower = role.lower()
             if 'senior' in role_lower or 'lead' in role_lower:
-                keywords.extend(['leadership', 'mentoring', 'team management'])
+                keywords += _SENIOR_KW
             if 'manager' in role_lower:
-                keywords.extend(['project management', 'stakeholder management', 
-                               'strategic planning'])
+                keywords += _MANAGER_KW
             if 'engineer' in role_lower or 'developer' in role_lower:
-                keywords.extend(['problem solving', 'technical design', 
-                               'code review'])
+                keywords += _ENGINEER_KW
         
-        return list(set(keywords))  # Remove duplicates
+        # Then industry-specific keywords
+        industry_lower = industry.lower()
+        hit = cls.INDUSTRY_KEYWORDS.get(industry_lower)
+        if hit is not None:
+            keywords += hit
+        else:
+            # Fall back to matching an industry name inside a longer description
+            for ind, kw_list in cls.INDUSTRY_KEYWORDS.items():
+                if ind in industry_lower:
+                    keywords += kw_list
+                    break
+        
+        # Ordered dedup: curated order is kept, so output is deterministic
+        return tuple(dict.fromkeys(keywords))
     
     def enhance_achievements(self, achievement_text: str) -> str:
         """
@@ -187,11 +305,12 @@ class CVOptimizer:
         """
         enhanced = achievement_text.strip()
         
-        # Check if it starts with a weak phrase
-        for weak, strong_options in self.PHRASE_IMPROVEMENTS.items():
-            if enhanced.lower().startswith(weak):
-                strong = strong_options.split('|')[0]
-                enhanced = strong.capitalize() + enhanced[len(weak):]
+        # Check if it starts with a weak phrase; lower-casing just the prefix
+        # is enough since no weak phrase is longer than it
+        lower_prefix = enhanced[:self._weak_prefix_len].lower()
+        for weak, strong, weak_len in self._achievement_rewrites:
+            if lower_prefix.startswith(weak):
+                enhanced = strong + enhanced[weak_len:]
                 break
         
         # Ensure it starts with an action verb (capitalize first letter)
@@ -226,25 +345,21 @@ class CVOptimizer:
         else:
             exp_desc = "highly accomplished"
         
-        # Build summary
-        summary_parts = [
-            f"{exp_desc.capitalize()} {role} with {years_experience}+ years of experience"
-        ]
-        
         # Add skills
+        skills_text = ""
         if key_skills:
-            skills_text = ", ".join(key_skills[:4])
-            summary_parts.append(f"specializing in {skills_text}")
+            skills_text = f" specializing in {', '.join(key_skills[:4])}"
         
-        # Add achievements if provided
+        # Add achievements if provided, as a sentence of their own
+        achievements_text = ""
         if achievements:
-            summary_parts.append(
-                f"Proven track record of {achievements[0].lower()}"
-            )
-        
-        summary = " ".join(summary_parts) + "."
+            achievements_text = f". Proven track record of {achievements[0].lower()}"
         
-        return summary
+        # Build summary in a single formatting step
+        return (
+            f"{exp_desc.capitalize()} {role} with {years_experience}+ years of experience"
+            f"{skills_text}{achievements_text}."
+        )
     
     def format_achievement_with_metrics(self, action: str, result: str, 
                                        metric: str = "") -> str:
@@ -280,12 +395,9 @@ class CVOptimizer:
         optimized = cv_text
         
         # Extract important keywords from job description
-        jd_words = re.findall(r'\b[A-Za-z]{3,}\b', job_description)
-        word_freq = {}
-        for word in jd_words:
-            word_lower = word.lower()
-            if word_lower not in ['the', 'and', 'for', 'with', 'that', 'this']:
-                word_freq[word_lower] = word_freq.get(word_lower, 0) + 1
+        word_freq = Counter(map(str.lower, _WORD_RE.findall(job_description)))
+        for stopword in _STOPWORDS:
+            word_freq.pop(stopword, None)
         
         # Find important keywords (appear 3+ times)
         important_keywords = [
@@ -293,11 +405,11 @@ class CVOptimizer:
             if freq >= 3
         ]
         
-        # Check which keywords are missing from CV
-        cv_lower = cv_text.lower()
+        # Check which keywords are missing from CV, comparing whole words
+        cv_tokens = set(map(str.lower, _WORD_RE.findall(cv_text)))
         missing_keywords = [
             kw for kw in important_keywords 
-            if kw not in cv_lower
+            if kw not in cv_tokens
         ]
         
         if missing_keywords: